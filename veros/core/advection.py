@@ -1,5 +1,4 @@
 from .. import veros_method
-from ..variables import allocate
 from .utilities import pad_z_edges, where
 
 
@@ -12,7 +11,7 @@ def _calc_cr(vs, rjp, rj, rjm, vel):
     return where(vs, vel > 0., rjm, rjp) / where(vs, np.abs(rj) < eps, eps, rj)
 
 
-@veros_method
+@veros_method(inline=True)
 def _adv_superbee(vs, vel, var, mask, dx, axis):
     def limiter(cr):
         return np.maximum(0., np.maximum(np.minimum(1., 2 * cr), np.minimum(2., cr)))
@@ -33,12 +32,13 @@ def _adv_superbee(vs, vel, var, mask, dx, axis):
         dx = dx[np.newaxis, np.newaxis, :-1]
     else:
         raise ValueError('axis must be 0, 1, or 2')
-    uCFL = np.abs(velfac * vel[s] * vs.dt_tracer / dx)
+    vel_s = velfac * vel[s]
+    uCFL = np.abs(vel_s * vs.dt_tracer / dx)
     rjp = (var[sp2] - var[sp1]) * mask[sp1]
     rj = (var[sp1] - var[s]) * mask[s]
     rjm = (var[s] - var[sm1]) * mask[sm1]
     cr = limiter(_calc_cr(vs, rjp, rj, rjm, vel[s]))
-    return velfac * vel[s] * (var[sp1] + var[s]) * 0.5 - np.abs(velfac * vel[s]) * ((1. - cr) + uCFL * cr) * rj * 0.5
+    return vel_s * (var[sp1] + var[s]) * 0.5 - np.abs(vel_s) * ((1. - cr) + uCFL * cr) * rj * 0.5
 
 
 @veros_method
@@ -104,9 +104,9 @@ def calculate_velocity_on_wgrid(vs):
         vs.maskV[:, :, -1] * 0.5 * vs.dzt[-1:] / vs.dzw[-1:]
 
     # redirect velocity at bottom and at topography
-    vs.u_wgrid[:, :, 0] = vs.u_wgrid[:, :, 0] + vs.u[:, :, 0, vs.tau] \
+    vs.u_wgrid[:, :, 0] += vs.u[:, :, 0, vs.tau] \
         * vs.maskU[:, :, 0] * 0.5 * vs.dzt[0:1] / vs.dzw[0:1]
-    vs.v_wgrid[:, :, 0] = vs.v_wgrid[:, :, 0] + vs.v[:, :, 0, vs.tau] \
+    vs.v_wgrid[:, :, 0] += vs.v[:, :, 0, vs.tau] \
         * vs.maskV[:, :, 0] * 0.5 * vs.dzt[0:1] / vs.dzw[0:1]
     mask = vs.maskW[:-1, :, :-1] * vs.maskW[1:, :, :-1]
     vs.u_wgrid[:-1, :, 1:] += (vs.u_wgrid[:-1, :, :-1] * vs.dzw[np.newaxis, np.newaxis, :-1]
@@ -119,11 +119,11 @@ def calculate_velocity_on_wgrid(vs):
 
     # vertical advection velocity on W grid from continuity
     vs.w_wgrid[:, :, 0] = 0.
-    vs.w_wgrid[1:, 1:, :] = np.cumsum(-vs.dzw[np.newaxis, np.newaxis, :] *
-                                         ((vs.u_wgrid[1:, 1:, :] - vs.u_wgrid[:-1, 1:, :]) / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis])
-                                          + (vs.cosu[np.newaxis, 1:, np.newaxis] * vs.v_wgrid[1:, 1:, :] -
-                                             vs.cosu[np.newaxis, :-1, np.newaxis] * vs.v_wgrid[1:, :-1, :])
-                                          / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])), axis=2)
+    np.cumsum(-vs.dzw[np.newaxis, np.newaxis, :] *
+              ((vs.u_wgrid[1:, 1:, :] - vs.u_wgrid[:-1, 1:, :]) / vs.cost_dxt[1:, 1:]
+               + (vs.cosu[np.newaxis, 1:, np.newaxis] * vs.v_wgrid[1:, 1:, :] -
+                  vs.cosu[np.newaxis, :-1, np.newaxis] * vs.v_wgrid[1:, :-1, :])
+               / vs.cost_dyt[:, 1:]), axis=2, out=vs.w_wgrid[1:, 1:, :])
 
 
 @veros_method
@@ -131,17 +131,9 @@ def adv_flux_superbee_wgrid(vs, adv_fe, adv_fn, adv_ft, var):
     """
     Calculates advection of a tracer defined on Wgrid
     """
-    maskUtr = allocate(vs, ('xt', 'yt', 'zw'))
-    maskUtr[:-1, :, :] = vs.maskW[1:, :, :] * vs.maskW[:-1, :, :]
-    adv_fe[1:-2, 2:-2, :] = _adv_superbee(vs, vs.u_wgrid, var, maskUtr, vs.dxt, 0)
-
-    maskVtr = allocate(vs, ('xt', 'yt', 'zw'))
-    maskVtr[:, :-1, :] = vs.maskW[:, 1:, :] * vs.maskW[:, :-1, :]
-    adv_fn[2:-2, 1:-2, :] = _adv_superbee(vs, vs.v_wgrid, var, maskVtr, vs.dyt, 1)
-
-    maskWtr = allocate(vs, ('xt', 'yt', 'zw'))
-    maskWtr[:, :, :-1] = vs.maskW[:, :, 1:] * vs.maskW[:, :, :-1]
-    adv_ft[2:-2, 2:-2, :-1] = _adv_superbee(vs, vs.w_wgrid, var, maskWtr, vs.dzw, 2)
+    adv_fe[1:-2, 2:-2, :] = _adv_superbee(vs, vs.u_wgrid, var, vs.maskUtr, vs.dxt, 0)
+    adv_fn[2:-2, 1:-2, :] = _adv_superbee(vs, vs.v_wgrid, var, vs.maskVtr, vs.dyt, 1)
+    adv_ft[2:-2, 2:-2, :-1] = _adv_superbee(vs, vs.w_wgrid, var, vs.maskWtr, vs.dzw, 2)
     adv_ft[..., -1] = 0.0
 
 
@@ -150,19 +142,16 @@ def adv_flux_upwind_wgrid(vs, adv_fe, adv_fn, adv_ft, var):
     """
     Calculates advection of a tracer defined on Wgrid
     """
-    maskUtr = vs.maskW[2:-1, 2:-2, :] * vs.maskW[1:-2, 2:-2, :]
-    rj = (var[2:-1, 2:-2, :] - var[1:-2, 2:-2, :]) * maskUtr
+    rj = (var[2:-1, 2:-2, :] - var[1:-2, 2:-2, :]) * vs.maskUtr[1:-2, 2:-2, :]
     adv_fe[1:-2, 2:-2, :] = vs.u_wgrid[1:-2, 2:-2, :] * (var[2:-1, 2:-2, :] + var[1:-2, 2:-2, :]) * 0.5 \
         - np.abs(vs.u_wgrid[1:-2, 2:-2, :]) * rj * 0.5
 
-    maskVtr = vs.maskW[2:-2, 2:-1, :] * vs.maskW[2:-2, 1:-2, :]
-    rj = (var[2:-2, 2:-1, :] - var[2:-2, 1:-2, :]) * maskVtr
+    rj = (var[2:-2, 2:-1, :] - var[2:-2, 1:-2, :]) * vs.maskVtr[2:-2, 1:-2, :]
     adv_fn[2:-2, 1:-2, :] = vs.cosu[np.newaxis, 1:-2, np.newaxis] * vs.v_wgrid[2:-2, 1:-2, :] * \
         (var[2:-2, 2:-1, :] + var[2:-2, 1:-2, :]) * 0.5 \
         - np.abs(vs.cosu[np.newaxis, 1:-2, np.newaxis] * vs.v_wgrid[2:-2, 1:-2, :]) * rj * 0.5
 
-    maskWtr = vs.maskW[2:-2, 2:-2, 1:] * vs.maskW[2:-2, 2:-2, :-1]
-    rj = (var[2:-2, 2:-2, 1:] - var[2:-2, 2:-2, :-1]) * maskWtr
+    rj = (var[2:-2, 2:-2, 1:] - var[2:-2, 2:-2, :-1]) * vs.maskWtr[2:-2, 2:-2, :-1]
     adv_ft[2:-2, 2:-2, :-1] = vs.w_wgrid[2:-2, 2:-2, :-1] * (var[2:-2, 2:-2, 1:] + var[2:-2, 2:-2, :-1]) * 0.5 \
         - np.abs(vs.w_wgrid[2:-2, 2:-2, :-1]) * rj * 0.5
     adv_ft[:, :, -1] = 0.
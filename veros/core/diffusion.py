@@ -1,14 +1,25 @@
 import math
 
 from .. import veros_method
-from ..variables import allocate
+from ..variables import allocate, scratch
 from . import utilities
 
 
+@veros_method(inline=True)
+def _dissipation_masks(vs, ks):
+    land_mask = ks >= 0
+    edge_mask = land_mask[:, :, np.newaxis] & (
+        np.arange(vs.nz - 1)[np.newaxis, np.newaxis, :] == ks[:, :, np.newaxis])
+    water_mask = land_mask[:, :, np.newaxis] & (
+        np.arange(vs.nz - 1)[np.newaxis, np.newaxis, :] > ks[:, :, np.newaxis])
+    return land_mask, edge_mask, water_mask
+
+
 @veros_method(inline=True)
 def dissipation_on_wgrid(vs, out, int_drhodX=None, aloc=None, ks=None):
     if aloc is None:
-        aloc = allocate(vs, ('xt', 'yt', 'zw'))
+        # persistent scratch; the ghost ring is never written and stays zero
+        aloc = scratch(vs, '_dissipation_aloc', ('xt', 'yt', 'zw'))
         aloc[1:-1, 1:-1, :] = 0.5 * vs.grav / vs.rho_0 \
             * ((int_drhodX[2:, 1:-1, :] - int_drhodX[1:-1, 1:-1, :]) * vs.flux_east[1:-1, 1:-1, :]
              + (int_drhodX[1:-1, 1:-1, :] - int_drhodX[:-2, 1:-1, :]) * vs.flux_east[:-2, 1:-1, :]) \
@@ -18,13 +29,14 @@ def dissipation_on_wgrid(vs, out, int_drhodX=None, aloc=None, ks=None):
             / (vs.dyt[np.newaxis, 1:-1, np.newaxis] * vs.cost[np.newaxis, 1:-1, np.newaxis])
 
     if ks is None:
-        ks = vs.kbot[:, :] - 1
-
-    land_mask = ks >= 0
-    edge_mask = land_mask[:, :, np.newaxis] & (
-        np.arange(vs.nz - 1)[np.newaxis, np.newaxis, :] == ks[:, :, np.newaxis])
-    water_mask = land_mask[:, :, np.newaxis] & (
-        np.arange(vs.nz - 1)[np.newaxis, np.newaxis, :] > ks[:, :, np.newaxis])
+        # kbot is static, so the T grid masks are built once and reused
+        masks = getattr(vs, '_dissipation_masks', None)
+        if masks is None:
+            masks = _dissipation_masks(vs, vs.kbot[:, :] - 1)
+            vs._dissipation_masks = masks
+    else:
+        masks = _dissipation_masks(vs, ks)
+    land_mask, edge_mask, water_mask = masks
 
     dzw_pad = utilities.pad_z_edges(vs, vs.dzw)
     out[:, :, :-1] += (0.5 * (aloc[:, :, :-1] + aloc[:, :, 1:])
@@ -44,22 +56,27 @@ def tempsalt_biharmonic(vs):
 
     fxa = math.sqrt(abs(vs.K_hbi))
 
+    # metric denominators are identical in every stanza below, so build them only once
+    cost_dxu = vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]
+    cost_dxt = vs.cost_dxt[1:, 1:]
+    cost_dyt = vs.cost_dyt[:, 1:]
+
     vs.flux_east[:-1, :, :] = -fxa * (vs.temp[1:, :, :, vs.tau] - vs.temp[:-1, :, :, vs.tau]) \
-        / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]) * vs.maskU[:-1, :, :]
+        / cost_dxu * vs.maskU[:-1, :, :]
     vs.flux_east[:, -1, :] = 0.
     vs.flux_north[:, :-1, :] = -fxa * (vs.temp[:, 1:, :, vs.tau] - vs.temp[:, :-1, :, vs.tau]) \
         / vs.dyu[np.newaxis, :-1, np.newaxis] * vs.maskV[:, :-1, :] * vs.cosu[np.newaxis, :-1, np.newaxis]
     vs.flux_north[:, -1, :] = 0.
 
     del2[1:, 1:, :] = vs.maskT[1:, 1:, :] * (vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis]) \
+        / cost_dxt \
         + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])
+        / cost_dyt
 
     utilities.enforce_boundaries(vs, del2)
 
     vs.flux_east[:-1, :, :] = fxa * (del2[1:, :, :] - del2[:-1, :, :]) \
-        / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]) \
+        / cost_dxu \
         * vs.maskU[:-1, :, :]
     vs.flux_north[:, :-1, :] = fxa * (del2[:, 1:, :] - del2[:, :-1, :]) \
         / vs.dyu[np.newaxis, :-1, np.newaxis] * vs.maskV[:, :-1, :] \
@@ -69,9 +86,9 @@ def tempsalt_biharmonic(vs):
 
     # update tendency
     vs.dtemp_hmix[1:, 1:, :] = vs.maskT[1:, 1:, :] * (vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis]) \
+        / cost_dxt \
         + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])
+        / cost_dyt
     vs.temp[:, :, :, vs.taup1] += vs.dt_tracer * vs.dtemp_hmix * vs.maskT
 
     if vs.enable_conserve_energy:
@@ -81,7 +98,7 @@ def tempsalt_biharmonic(vs):
         dissipation_on_wgrid(vs, vs.P_diss_hmix, int_drhodX=vs.int_drhodT[..., vs.tau])
 
     vs.flux_east[:-1, :, :] = -fxa * (vs.salt[1:, :, :, vs.tau] - vs.salt[:-1, :, :, vs.tau]) \
-        / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]) * vs.maskU[:-1, :, :]
+        / cost_dxu * vs.maskU[:-1, :, :]
     vs.flux_north[:, :-1, :] = -fxa * (vs.salt[:, 1:, :, vs.tau] - vs.salt[:, :-1, :, vs.tau]) \
         / vs.dyu[np.newaxis, :-1, np.newaxis] * vs.maskV[:, :-1, :] * vs.cosu[np.newaxis, :-1, np.newaxis]
     vs.flux_east[-1, :, :] = 0.
@@ -89,14 +106,14 @@ def tempsalt_biharmonic(vs):
     vs.flux_north[:, -1, :] = 0.
 
     del2[1:, 1:, :] = vs.maskT[1:, 1:, :] * (vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis]) \
+        / cost_dxt \
         + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])
+        / cost_dyt
 
     utilities.enforce_boundaries(vs, del2)
 
     vs.flux_east[:-1, :, :] = fxa * (del2[1:, :, :] - del2[:-1, :, :]) \
-        / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]) \
+        / cost_dxu \
         * vs.maskU[:-1, :, :]
     vs.flux_north[:, :-1, :] = fxa * (del2[:, 1:, :] - del2[:, :-1, :]) \
         / vs.dyu[np.newaxis, :-1, np.newaxis] \
@@ -106,9 +123,9 @@ def tempsalt_biharmonic(vs):
 
     # update tendency
     vs.dsalt_hmix[1:, 1:, :] = vs.maskT[1:, 1:, :] * (vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis]) \
+        / cost_dxt \
         + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])
+        / cost_dyt
     vs.salt[:, :, :, vs.taup1] += vs.dt_tracer * vs.dsalt_hmix * vs.maskT
 
     if vs.enable_conserve_energy:
@@ -121,6 +138,11 @@ def tempsalt_diffusion(vs):
     Diffusion of temp and salinity,
     dissipation of dyn. Enthalpy is stored
     """
+    if vs.enable_hor_friction_cos_scaling:
+        # same scaling is applied to both tracers, so compute it only once
+        cos_scale_t = vs.cost[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
+        cos_scale_u = vs.cosu[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
+
     # horizontal diffusion of temperature
     vs.flux_east[:-1, :, :] = vs.K_h * (vs.temp[1:, :, :, vs.tau] - vs.temp[:-1, :, :, vs.tau]) \
         / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxu[:-1, np.newaxis, np.newaxis]) * vs.maskU[:-1, :, :]
@@ -131,13 +153,13 @@ def tempsalt_diffusion(vs):
     vs.flux_north[:, -1, :] = 0.
 
     if vs.enable_hor_friction_cos_scaling:
-        vs.flux_east[...] *= vs.cost[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
-        vs.flux_north[...] *= vs.cosu[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
+        vs.flux_east[...] *= cos_scale_t
+        vs.flux_north[...] *= cos_scale_u
 
     vs.dtemp_hmix[1:, 1:, :] = vs.maskT[1:, 1:, :] * ((vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :])
-                                                            / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis])
+                                                            / vs.cost_dxt[1:, 1:]
                                                             + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :])
-                                                            / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis]))
+                                                            / vs.cost_dyt[:, 1:])
     vs.temp[:, :, :, vs.taup1] += vs.dt_tracer * vs.dtemp_hmix * vs.maskT
 
     if vs.enable_conserve_energy:
@@ -156,13 +178,13 @@ def tempsalt_diffusion(vs):
     vs.flux_north[:, -1, :] = 0.
 
     if vs.enable_hor_friction_cos_scaling:
-        vs.flux_east[...] *= vs.cost[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
-        vs.flux_north[...] *= vs.cosu[np.newaxis, :, np.newaxis] ** vs.hor_friction_cosPower
+        vs.flux_east[...] *= cos_scale_t
+        vs.flux_north[...] *= cos_scale_u
 
     vs.dsalt_hmix[1:, 1:, :] = vs.maskT[1:, 1:, :] * ((vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :])
-                                                    / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis])
+                                                    / vs.cost_dxt[1:, 1:]
                                                     + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :])
-                                                    / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis]))
+                                                    / vs.cost_dyt[:, 1:])
     vs.salt[:, :, :, vs.taup1] += vs.dt_tracer * vs.dsalt_hmix * vs.maskT
 
     if vs.enable_conserve_energy:
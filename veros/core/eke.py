@@ -1,7 +1,7 @@
 import math
 
 from .. import veros_method, runtime_settings as rs
-from ..variables import allocate
+from ..variables import allocate, scratch
 from . import utilities, advection
 
 
@@ -142,8 +142,12 @@ def integrate_eke(vs):
     """
     vertical diffusion of EKE,forcing and dissipation
     """
-    ks = vs.kbot[2:-2, 2:-2] - 1
-    delta, a_tri, b_tri, c_tri, d_tri = (allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False) for _ in range(5))
+    ks = vs.ks_bot
+    # persistent scratch buffers; entries not written below stay zero across calls
+    delta, a_tri, b_tri, c_tri, d_tri = (
+        scratch(vs, '_eke_' + name, ('xt', 'yt', 'zt'), include_ghosts=False)
+        for name in ('delta', 'a_tri', 'b_tri', 'c_tri', 'd_tri')
+    )
     delta[:, :, :-1] = vs.dt_tracer / vs.dzt[np.newaxis, np.newaxis, 1:] * 0.5 \
         * (vs.kappaM[2:-2, 2:-2, :-1] + vs.kappaM[2:-2, 2:-2, 1:]) * vs.alpha_eke
     a_tri[:, :, 1:-1] = -delta[:, :, :-2] / vs.dzw[1:-1]
@@ -156,7 +160,8 @@ def integrate_eke(vs):
         + vs.dt_tracer * c_int[2:-2, 2:-2, :]
     c_tri[:, :, :-1] = -delta[:, :, :-1] / vs.dzw[np.newaxis, np.newaxis, :-1]
     d_tri[:, :, :] = vs.eke[2:-2, 2:-2, :, vs.tau] + vs.dt_tracer * forc[2:-2, 2:-2, :]
-    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge)
+    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge,
+                                               masks=vs.implicit_masks)
     vs.eke[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, water_mask, sol, vs.eke[2:-2, 2:-2, :, vs.taup1])
 
     """
@@ -215,9 +220,9 @@ def integrate_eke(vs):
     vs.flux_north[:, -1, :] = 0.
     vs.eke[2:-2, 2:-2, :, vs.taup1] += vs.dt_tracer * vs.maskW[2:-2, 2:-2, :] \
         * ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-           / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+           / vs.cost_dxt[2:-2, 2:-2]
            + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-           / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+           / vs.cost_dyt[:, 2:-2])
 
     """
     add tendency due to advection
@@ -232,9 +237,9 @@ def integrate_eke(vs):
             )
     if vs.enable_eke_superbee_advection or vs.enable_eke_upwind_advection:
         vs.deke[2:-2, 2:-2, :, vs.tau] = vs.maskW[2:-2, 2:-2, :] * (-(vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+                                                                    / vs.cost_dxt[2:-2, 2:-2]
                                                                     - (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                                    / vs.cost_dyt[:, 2:-2])
         vs.deke[:, :, 0, vs.tau] += -vs.flux_top[:, :, 0] / vs.dzw[0]
         vs.deke[:, :, 1:-1, vs.tau] += -(vs.flux_top[:, :, 1:-1] -
                                                vs.flux_top[:, :, :-2]) / vs.dzw[np.newaxis, np.newaxis, 1:-1]
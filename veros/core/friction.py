@@ -243,20 +243,23 @@ def harmonic_friction(vs):
     """
     diss = allocate(vs, ('xt', 'yt', 'zt'))
 
+    if vs.enable_hor_friction_cos_scaling:
+        # evaluate the power functions once, they are reused in every stanza
+        cost_pow = vs.cost ** vs.hor_friction_cosPower
+        cosu_pow = vs.cosu ** vs.hor_friction_cosPower
+
     """
     Zonal velocity
     """
     if vs.enable_hor_friction_cos_scaling:
-        fxa = vs.cost**vs.hor_friction_cosPower
-        vs.flux_east[:-1] = vs.A_h * fxa[np.newaxis, :, np.newaxis] * (vs.u[1:, :, :, vs.tau] - vs.u[:-1, :, :, vs.tau]) \
+        vs.flux_east[:-1] = vs.A_h * cost_pow[np.newaxis, :, np.newaxis] * (vs.u[1:, :, :, vs.tau] - vs.u[:-1, :, :, vs.tau]) \
             / (vs.cost * vs.dxt[1:, np.newaxis])[:, :, np.newaxis] * vs.maskU[1:] * vs.maskU[:-1]
-        fxa = vs.cosu**vs.hor_friction_cosPower
-        vs.flux_north[:, :-1] = vs.A_h * fxa[np.newaxis, :-1, np.newaxis] * (vs.u[:, 1:, :, vs.tau] - vs.u[:, :-1, :, vs.tau]) \
+        vs.flux_north[:, :-1] = vs.A_h * cosu_pow[np.newaxis, :-1, np.newaxis] * (vs.u[:, 1:, :, vs.tau] - vs.u[:, :-1, :, vs.tau]) \
             / vs.dyu[np.newaxis, :-1, np.newaxis] * vs.maskU[:, 1:] * vs.maskU[:, :-1] * vs.cosu[np.newaxis, :-1, np.newaxis]
         if vs.enable_noslip_lateral:
-             vs.flux_north[:, :-1] += 2 * vs.A_h * fxa[np.newaxis, :-1, np.newaxis] * (vs.u[:, 1:, :, vs.tau]) \
+             vs.flux_north[:, :-1] += 2 * vs.A_h * cosu_pow[np.newaxis, :-1, np.newaxis] * (vs.u[:, 1:, :, vs.tau]) \
                 / vs.dyu[np.newaxis, :-1, np.newaxis] * vs.maskU[:, 1:] * (1 - vs.maskU[:, :-1]) * vs.cosu[np.newaxis, :-1, np.newaxis]\
-                - 2 * vs.A_h * fxa[np.newaxis, :-1, np.newaxis] * (vs.u[:, :-1, :, vs.tau]) \
+                - 2 * vs.A_h * cosu_pow[np.newaxis, :-1, np.newaxis] * (vs.u[:, :-1, :, vs.tau]) \
                 / vs.dyu[np.newaxis, :-1, np.newaxis] * (1 - vs.maskU[:, 1:]) * vs.maskU[:, :-1] * vs.cosu[np.newaxis, :-1, np.newaxis]
     else:
         vs.flux_east[:-1, :, :] = vs.A_h * (vs.u[1:, :, :, vs.tau] - vs.u[:-1, :, :, vs.tau]) \
@@ -301,9 +304,9 @@ def harmonic_friction(vs):
             * (vs.v[1:, :, :, vs.tau] - vs.v[:-1, :, :, vs.tau]) \
             / (vs.cosu * vs.dxu[:-1, np.newaxis])[:, :, np.newaxis] * vs.maskV[1:] * vs.maskV[:-1]
         if vs.enable_noslip_lateral:
-            vs.flux_east[:-1] += 2 * vs.A_h * fxa[np.newaxis, :, np.newaxis] * vs.v[1:, :, :, vs.tau] \
+            vs.flux_east[:-1] += 2 * vs.A_h * cosu_pow[np.newaxis, :, np.newaxis] * vs.v[1:, :, :, vs.tau] \
                 / (vs.cosu * vs.dxu[:-1, np.newaxis])[:, :, np.newaxis] * vs.maskV[1:] * (1 - vs.maskV[:-1]) \
-                - 2 * vs.A_h * fxa[np.newaxis, :, np.newaxis] * vs.v[:-1, :, :, vs.tau] \
+                - 2 * vs.A_h * cosu_pow[np.newaxis, :, np.newaxis] * vs.v[:-1, :, :, vs.tau] \
                 / (vs.cosu * vs.dxu[:-1, np.newaxis])[:, :, np.newaxis] * (1 - vs.maskV[1:]) * vs.maskV[:-1]
 
         vs.flux_north[:, :-1] = vs.A_h * vs.cost[np.newaxis, 1:, np.newaxis] ** vs.hor_friction_cosPower \
@@ -372,7 +375,7 @@ def biharmonic_friction(vs):
     del2[1:, 1:, :] = (vs.flux_east[1:, 1:, :] - vs.flux_east[:-1, 1:, :]) \
         / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dxu[1:, np.newaxis, np.newaxis]) \
         + (vs.flux_north[1:, 1:, :] - vs.flux_north[1:, :-1, :]) \
-        / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis])
+        / vs.cost_dyt[:, 1:]
 
     vs.flux_east[:-1, :, :] = fxa * (del2[1:, :, :] - del2[:-1, :, :]) \
         / (vs.cost[np.newaxis, :, np.newaxis] * vs.dxt[1:, np.newaxis, np.newaxis]) \
@@ -394,7 +397,7 @@ def biharmonic_friction(vs):
     vs.du_mix[2:-2, 2:-2, :] += -vs.maskU[2:-2, 2:-2, :] * ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
                                                           / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxu[2:-2, np.newaxis, np.newaxis])
                                                           + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                          / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                          / vs.cost_dyt[:, 2:-2])
     if vs.enable_conserve_energy:
         """
         diagnose dissipation by lateral friction
@@ -407,7 +410,7 @@ def biharmonic_friction(vs):
             / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxu[1:-2, np.newaxis, np.newaxis])  \
             - 0.5 * ((vs.u[1:-2, 3:-1, :, vs.tau] - vs.u[1:-2, 2:-2, :, vs.tau]) * vs.flux_north[1:-2, 2:-2, :]
                    + (vs.u[1:-2, 2:-2, :, vs.tau] - vs.u[1:-2, 1:-3, :, vs.tau]) * vs.flux_north[1:-2, 1:-3, :]) \
-            / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis])
+            / vs.cost_dyt[:, 2:-2]
         vs.K_diss_h[...] = 0.
         vs.K_diss_h[...] += numerics.calc_diss(vs, diss, 'U')
 
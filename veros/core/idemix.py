@@ -1,6 +1,6 @@
 from . import advection, utilities
 from .. import veros_method, runtime_settings as rs
-from ..variables import allocate
+from ..variables import allocate, scratch
 
 """
 IDEMIX as in Olbers and Eden, 2013
@@ -12,12 +12,12 @@ def set_idemix_parameter(vs):
     """
     set main IDEMIX parameter
     """
-    bN0 = np.sum(np.sqrt(np.maximum(0., vs.Nsqr[:, :, :-1, vs.tau]))
+    sqrt_Nsqr = np.sqrt(np.maximum(0., vs.Nsqr[..., vs.tau]))
+    bN0 = np.sum(sqrt_Nsqr[:, :, :-1]
                  * vs.dzw[np.newaxis, np.newaxis, :-1] * vs.maskW[:, :, :-1], axis=2) \
-        + np.sqrt(np.maximum(0., vs.Nsqr[:, :, -1, vs.tau])) \
+        + sqrt_Nsqr[:, :, -1] \
         * 0.5 * vs.dzw[-1:] * vs.maskW[:, :, -1]
-    fxa = np.sqrt(np.maximum(0., vs.Nsqr[..., vs.tau])) / \
-        (1e-22 + np.abs(vs.coriolis_t[..., np.newaxis]))
+    fxa = sqrt_Nsqr / (1e-22 + np.abs(vs.coriolis_t[..., np.newaxis]))
     cstar = np.maximum(1e-2, bN0[:, :, np.newaxis] / (vs.pi * vs.jstar))
     vs.c0[...] = np.maximum(0., vs.gamma * cstar * gofx2(vs, fxa) * vs.maskW)
     vs.v0[...] = np.maximum(0., vs.gamma * cstar * hofx1(vs, fxa) * vs.maskW)
@@ -30,9 +30,13 @@ def integrate_idemix(vs):
     """
     integrate idemix on W grid
     """
-    a_tri, b_tri, c_tri, d_tri, delta = (allocate(vs, ('xt', 'yt', 'zw'), include_ghosts=False) for _ in range(5))
-    forc = allocate(vs, ('xt', 'yt', 'zw'))
-    maxE_iw = allocate(vs, ('xt', 'yt', 'zw'))
+    # persistent scratch buffers; entries not written below stay zero across calls
+    a_tri, b_tri, c_tri, d_tri, delta = (
+        scratch(vs, '_idemix_' + name, ('xt', 'yt', 'zw'), include_ghosts=False)
+        for name in ('a_tri', 'b_tri', 'c_tri', 'd_tri', 'delta')
+    )
+    forc = scratch(vs, '_idemix_forc', ('xt', 'yt', 'zw'), fill=None)
+    maxE_iw = scratch(vs, '_idemix_maxE_iw', ('xt', 'yt', 'zw'), fill=None)
 
     """
     forcing by EKE dissipation
@@ -80,27 +84,29 @@ def integrate_idemix(vs):
     """
     vertical diffusion and dissipation is solved implicitly
     """
-    ks = vs.kbot[2:-2, 2:-2] - 1
+    ks = vs.ks_bot
     delta[:, :, :-1] = vs.dt_tracer * vs.tau_v / vs.dzt[np.newaxis, np.newaxis, 1:] * 0.5 \
         * (vs.c0[2:-2, 2:-2, :-1] + vs.c0[2:-2, 2:-2, 1:])
     delta[:, :, -1] = 0.
     a_tri[:, :, 1:-1] = -delta[:, :, :-2] * vs.c0[2:-2, 2:-2, :-2] \
         / vs.dzw[np.newaxis, np.newaxis, 1:-1]
     a_tri[:, :, -1] = -delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * vs.c0[2:-2, 2:-2, -2]
+    dissipation = vs.dt_tracer * vs.alpha_c[2:-2, 2:-2, :] * maxE_iw[2:-2, 2:-2, :]
     b_tri[:, :, 1:-1] = 1 + delta[:, :, 1:-1] * vs.c0[2:-2, 2:-2, 1:-1] / vs.dzw[np.newaxis, np.newaxis, 1:-1] \
         + delta[:, :, :-2] * vs.c0[2:-2, 2:-2, 1:-1] / vs.dzw[np.newaxis, np.newaxis, 1:-1] \
-        + vs.dt_tracer * vs.alpha_c[2:-2, 2:-2, 1:-1] * maxE_iw[2:-2, 2:-2, 1:-1]
+        + dissipation[:, :, 1:-1]
     b_tri[:, :, -1] = 1 + delta[:, :, -2] / (0.5 * vs.dzw[-1:]) * vs.c0[2:-2, 2:-2, -1] \
-        + vs.dt_tracer * vs.alpha_c[2:-2, 2:-2, -1] * maxE_iw[2:-2, 2:-2, -1]
+        + dissipation[:, :, -1]
     b_tri_edge = 1 + delta / vs.dzw * vs.c0[2:-2, 2:-2, :] \
-        + vs.dt_tracer * vs.alpha_c[2:-2, 2:-2, :] * maxE_iw[2:-2, 2:-2, :]
+        + dissipation
     c_tri[:, :, :-1] = -delta[:, :, :-1] / \
         vs.dzw[np.newaxis, np.newaxis, :-1] * vs.c0[2:-2, 2:-2, 1:]
     d_tri[...] = vs.E_iw[2:-2, 2:-2, :, vs.tau] + vs.dt_tracer * forc[2:-2, 2:-2, :]
     d_tri_edge = d_tri + vs.dt_tracer * \
         vs.forc_iw_bottom[2:-2, 2:-2, np.newaxis] / vs.dzw[np.newaxis, np.newaxis, :]
     d_tri[:, :, -1] += vs.dt_tracer * vs.forc_iw_surface[2:-2, 2:-2] / (0.5 * vs.dzw[-1:])
-    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge, d_edge=d_tri_edge)
+    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge, d_edge=d_tri_edge,
+                                               masks=vs.implicit_masks)
     vs.E_iw[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, water_mask, sol, vs.E_iw[2:-2, 2:-2, :, vs.taup1])
 
     """
@@ -125,9 +131,9 @@ def integrate_idemix(vs):
         vs.flux_north[:, -1, :] = 0.
         vs.E_iw[2:-2, 2:-2, :, vs.taup1] += vs.dt_tracer * vs.maskW[2:-2, 2:-2, :] \
             * ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-               / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+               / vs.cost_dxt[2:-2, 2:-2]
                + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-               / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+               / vs.cost_dyt[:, 2:-2])
 
     """
     add tendency due to advection
@@ -142,9 +148,9 @@ def integrate_idemix(vs):
 
     if vs.enable_idemix_superbee_advection or vs.enable_idemix_upwind_advection:
         vs.dE_iw[2:-2, 2:-2, :, vs.tau] = vs.maskW[2:-2, 2:-2, :] * (-(vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+                                                                    / vs.cost_dxt[2:-2, 2:-2]
                                                                     - (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                                    / vs.cost_dyt[:, 2:-2])
         vs.dE_iw[:, :, 0, vs.tau] += -vs.flux_top[:, :, 0] / vs.dzw[0:1]
         vs.dE_iw[:, :, 1:-1, vs.tau] += -(vs.flux_top[:, :, 1:-1] - vs.flux_top[:, :, :-2]) \
             / vs.dzw[np.newaxis, np.newaxis, 1:-1]
@@ -158,7 +164,7 @@ def integrate_idemix(vs):
                                                     - (0.5 + vs.AB_eps) * vs.dE_iw[:, :, :, vs.taum1])
 
 
-@veros_method
+@veros_method(inline=True)
 def gofx2(vs, x):
     if vs.pyom_compatibility_mode:
         x[x < 3.] = 3.
@@ -168,7 +174,7 @@ def gofx2(vs, x):
     return 2. / vs.pi / c * 0.9 * x**(-2. / 3.) * (1 - np.exp(-x / 4.3))
 
 
-@veros_method
+@veros_method(inline=True)
 def hofx1(vs, x):
     eps = np.finfo(x.dtype).eps  # prevent division by zero
     x = np.maximum(1. + eps, x)
@@ -3,7 +3,7 @@ from .. import utilities, diffusion
 from ...variables import allocate
 
 
-@veros_method
+@veros_method(inline=True)
 def _calc_tracer_fluxes(vs, tr, K_iso, K_skew):
     tr_pad = utilities.pad_z_edges(vs, tr[..., vs.tau])
 
@@ -62,11 +62,11 @@ def _calc_tracer_fluxes(vs, tr, K_iso, K_skew):
     vs.flux_top[:, :, -1] = 0.
 
 
-@veros_method
+@veros_method(inline=True)
 def _calc_explicit_part(vs):
     aloc = allocate(vs, ('xt', 'yt', 'zt'))
-    aloc[2:-2, 2:-2, :] = vs.maskT[2:-2, 2:-2, :] * ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :]) / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
-                                                   + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :]) / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+    aloc[2:-2, 2:-2, :] = vs.maskT[2:-2, 2:-2, :] * ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :]) / vs.cost_dxt[2:-2, 2:-2]
+                                                   + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :]) / vs.cost_dyt[:, 2:-2])
     aloc[:, :, 0] += vs.maskT[:, :, 0] * vs.flux_top[:, :, 0] / vs.dzt[0]
     aloc[:, :, 1:] += vs.maskT[:, :, 1:] * \
         (vs.flux_top[:, :, 1:] - vs.flux_top[:, :, :-1]) / \
@@ -74,25 +74,36 @@ def _calc_explicit_part(vs):
     return aloc
 
 
-@veros_method
+@veros_method(inline=True)
 def _calc_implicit_part(vs, tr):
-    ks = vs.kbot[2:-2, 2:-2] - 1
-
-    a_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    b_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    c_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    delta = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-
-    delta[:, :, :-1] = vs.dt_tracer / vs.dzw[np.newaxis, np.newaxis, :-1] * vs.K_33[2:-2, 2:-2, :-1]
-    delta[:, :, -1] = 0.
-    a_tri[:, :, 1:] = -delta[:, :, :-1] / vs.dzt[np.newaxis, np.newaxis, 1:]
-    b_tri[:, :, 1:-1] = 1 + (delta[:, :, 1:-1] + delta[:, :, :-2]) \
-                        / vs.dzt[np.newaxis, np.newaxis, 1:-1]
-    b_tri[:, :, -1] = 1 + delta[:, :, -2] / vs.dzt[np.newaxis, np.newaxis, -1]
-    b_tri_edge = 1 + (delta[:, :, :] / vs.dzt[np.newaxis, np.newaxis, :])
-    c_tri[:, :, :-1] = -delta[:, :, :-1] / vs.dzt[np.newaxis, np.newaxis, :-1]
+    # the tridiagonal coefficients depend only on K_33 and the grid, so they
+    # are built once per time step and shared between the temperature and
+    # salinity solves
+    cache = getattr(vs, '_implicit_tri_cache', None)
+    if cache is None or cache[0] != vs.itt:
+        ks = vs.ks_bot
+
+        a_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
+        b_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
+        c_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
+        # delta is fully overwritten below, so skip zero-filling it
+        delta = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False, fill=None)
+
+        delta[:, :, :-1] = vs.dt_tracer / vs.dzw[np.newaxis, np.newaxis, :-1] * vs.K_33[2:-2, 2:-2, :-1]
+        delta[:, :, -1] = 0.
+        a_tri[:, :, 1:] = -delta[:, :, :-1] / vs.dzt[np.newaxis, np.newaxis, 1:]
+        b_tri[:, :, 1:-1] = 1 + (delta[:, :, 1:-1] + delta[:, :, :-2]) \
+                            / vs.dzt[np.newaxis, np.newaxis, 1:-1]
+        b_tri[:, :, -1] = 1 + delta[:, :, -2] / vs.dzt[np.newaxis, np.newaxis, -1]
+        b_tri_edge = 1 + (delta[:, :, :] / vs.dzt[np.newaxis, np.newaxis, :])
+        c_tri[:, :, :-1] = -delta[:, :, :-1] / vs.dzt[np.newaxis, np.newaxis, :-1]
+        cache = (vs.itt, ks, a_tri, b_tri, c_tri, b_tri_edge)
+        vs._implicit_tri_cache = cache
+
+    _, ks, a_tri, b_tri, c_tri, b_tri_edge = cache
     sol, water_mask = utilities.solve_implicit(
-        vs, ks, a_tri, b_tri, c_tri, tr[2:-2, 2:-2, :, vs.taup1], b_edge=b_tri_edge
+        vs, ks, a_tri, b_tri, c_tri, tr[2:-2, 2:-2, :, vs.taup1], b_edge=b_tri_edge,
+        masks=vs.implicit_masks
     )
     tr[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, water_mask, sol, tr[2:-2, 2:-2, :, vs.taup1])
 
@@ -139,7 +139,7 @@ def vertical_velocity(vs):
         + (vs.cosu[np.newaxis, 1:, np.newaxis] * vs.v[1:, 1:, 1:, vs.taup1]
             - vs.cosu[np.newaxis, :-1, np.newaxis] * vs.v[1:, :-1, 1:, vs.taup1])
         / (vs.cost[np.newaxis, 1:, np.newaxis] * vs.dyt[np.newaxis, 1:, np.newaxis]))
-    vs.w[1:, 1:, :, vs.taup1] = np.cumsum(fxa, axis=2)
+    np.cumsum(fxa, axis=2, out=vs.w[1:, 1:, :, vs.taup1])
 
 
 @veros_method
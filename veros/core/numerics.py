@@ -145,6 +145,34 @@ def calc_topo(vs):
     vs.maskW[...] = vs.maskT
     vs.maskW[:, :, :-1] = np.minimum(vs.maskT[:, :, :-1], vs.maskT[:, :, 1:])
 
+    """
+    transport masks for advection of quantities defined on W grid
+    """
+    vs.maskUtr = np.zeros_like(vs.maskW)
+    vs.maskUtr[:-1, :, :] = vs.maskW[1:, :, :] * vs.maskW[:-1, :, :]
+    vs.maskVtr = np.zeros_like(vs.maskW)
+    vs.maskVtr[:, :-1, :] = vs.maskW[:, 1:, :] * vs.maskW[:, :-1, :]
+    vs.maskWtr = np.zeros_like(vs.maskW)
+    vs.maskWtr[:, :, :-1] = vs.maskW[:, :, 1:] * vs.maskW[:, :, :-1]
+
+    """
+    bottom cell index and masks for the implicit vertical solvers on the T grid
+    """
+    vs.ks_bot = vs.kbot[2:-2, 2:-2] - 1
+    land_mask = (vs.ks_bot >= 0)[:, :, np.newaxis]
+    k_idx = np.arange(vs.maskT.shape[2])[np.newaxis, np.newaxis, :]
+    vs.implicit_masks = (
+        land_mask,
+        land_mask & (k_idx == vs.ks_bot[:, :, np.newaxis]),
+        land_mask & (k_idx >= vs.ks_bot[:, :, np.newaxis]),
+    )
+
+    """
+    metric denominators for flux divergences, constant in time
+    """
+    vs.cost_dxt = vs.cost[np.newaxis, :, np.newaxis] * vs.dxt[:, np.newaxis, np.newaxis]
+    vs.cost_dyt = vs.cost[np.newaxis, :, np.newaxis] * vs.dyt[np.newaxis, :, np.newaxis]
+
     """
     total depth
     """
@@ -152,9 +180,9 @@ def calc_topo(vs):
     vs.hu[...] = np.sum(vs.maskU * vs.dzt[np.newaxis, np.newaxis, :], axis=2)
     vs.hv[...] = np.sum(vs.maskV * vs.dzt[np.newaxis, np.newaxis, :], axis=2)
 
-    mask = (vs.hu == 0).astype(np.float)
+    mask = (vs.hu == 0).astype(vs.default_float_type)
     vs.hur[...] = 1. / (vs.hu + mask) * (1 - mask)
-    mask = (vs.hv == 0).astype(np.float)
+    mask = (vs.hv == 0).astype(vs.default_float_type)
     vs.hvr[...] = 1. / (vs.hv + mask) * (1 - mask)
 
 
@@ -216,7 +244,7 @@ def solve_tridiag(vs, a, b, c, d):
     # fall back to scipy
     from scipy.linalg import lapack
     a[..., 0] = c[..., -1] = 0  # remove couplings between slices
-    return lapack.dgtsv(a.flatten()[1:], b.flatten(), c.flatten()[:-1], d.flatten())[3].reshape(a.shape)
+    return lapack.dgtsv(a.ravel()[1:], b.ravel(), c.ravel()[:-1], d.ravel())[3].reshape(a.shape)
 
 
 @veros_method(inline=True)
@@ -22,8 +22,9 @@ def solve_streamfunction(vs):
     vs.p_hydro[:, :, -1] = tmp[:, :, -1]
     tmp[:, :, :-1] += 0.5 * vs.rho[:, :, 1:, vs.tau] * \
         fxa * vs.dzw[:-1] * vs.maskT[:, :, :-1]
-    vs.p_hydro[:, :, -2::-1] = vs.maskT[:, :, -2::-1] * \
-        (vs.p_hydro[:, :, -1, np.newaxis] + np.cumsum(tmp[:, :, -2::-1], axis=2))
+    np.cumsum(tmp[:, :, -2::-1], axis=2, out=vs.p_hydro[:, :, -2::-1])
+    vs.p_hydro[:, :, :-1] += vs.p_hydro[:, :, -1, np.newaxis]
+    vs.p_hydro[:, :, :-1] *= vs.maskT[:, :, :-1]
 
     # add hydrostatic pressure gradient
     vs.du[2:-2, 2:-2, :, vs.tau] += \
@@ -93,14 +94,17 @@ def solve_streamfunction(vs):
         vs.dpsin[1:, vs.tau] = line_forc[1:]
 
     # integrate barotropic and baroclinic velocity forward in time
-    vs.psi[:, :, vs.taup1] = vs.psi[:, :, vs.tau] + vs.dt_mom * ((1.5 + vs.AB_eps) * vs.dpsi[:, :, vs.taup1]
-                                                               - (0.5 + vs.AB_eps) * vs.dpsi[:, :, vs.tau])
+    np.add(vs.psi[:, :, vs.tau], vs.dt_mom * ((1.5 + vs.AB_eps) * vs.dpsi[:, :, vs.taup1]
+                                            - (0.5 + vs.AB_eps) * vs.dpsi[:, :, vs.tau]),
+           out=vs.psi[:, :, vs.taup1])
     vs.psi[:, :, vs.taup1] += vs.dt_mom * np.sum(((1.5 + vs.AB_eps) * vs.dpsin[1:, vs.tau]
                                                            - (0.5 + vs.AB_eps) * vs.dpsin[1:, vs.taum1]) * vs.psin[:, :, 1:], axis=2)
-    vs.u[:, :, :, vs.taup1] = vs.u[:, :, :, vs.tau] + vs.dt_mom * (vs.du_mix + (1.5 + vs.AB_eps) * vs.du[:, :, :, vs.tau]
-                                                                             - (0.5 + vs.AB_eps) * vs.du[:, :, :, vs.taum1]) * vs.maskU
-    vs.v[:, :, :, vs.taup1] = vs.v[:, :, :, vs.tau] + vs.dt_mom * (vs.dv_mix + (1.5 + vs.AB_eps) * vs.dv[:, :, :, vs.tau]
-                                                                             - (0.5 + vs.AB_eps) * vs.dv[:, :, :, vs.taum1]) * vs.maskV
+    np.add(vs.u[:, :, :, vs.tau], vs.dt_mom * (vs.du_mix + (1.5 + vs.AB_eps) * vs.du[:, :, :, vs.tau]
+                                                         - (0.5 + vs.AB_eps) * vs.du[:, :, :, vs.taum1]) * vs.maskU,
+           out=vs.u[:, :, :, vs.taup1])
+    np.add(vs.v[:, :, :, vs.tau], vs.dt_mom * (vs.dv_mix + (1.5 + vs.AB_eps) * vs.dv[:, :, :, vs.tau]
+                                                         - (0.5 + vs.AB_eps) * vs.dv[:, :, :, vs.taum1]) * vs.maskV,
+           out=vs.v[:, :, :, vs.taup1])
 
     # subtract incorrect vertical mean from baroclinic velocity
     fpx = np.sum(vs.u[:, :, :, vs.taup1] * vs.maskU * vs.dzt, axis=2)
@@ -1,6 +1,6 @@
 from .. import veros_method
 from ..distributed import global_sum
-from ..variables import allocate
+from ..variables import allocate, scratch
 from . import advection, diffusion, isoneutral, density, utilities
 
 
@@ -24,9 +24,9 @@ def thermodynamics(vs):
                                 vs.flux_top, vs.Hd[:, :, :, vs.tau])
 
         vs.dHd[2:-2, 2:-2, :, vs.tau] = vs.maskT[2:-2, 2:-2, :] * (-(vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+                                                                    / vs.cost_dxt[2:-2, 2:-2]
                                                                 - (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                                    / vs.cost_dyt[:, 2:-2])
         vs.dHd[:, :, 0, vs.tau] += -vs.maskT[:, :, 0] \
             * vs.flux_top[:, :, 0] / vs.dzt[0]
         vs.dHd[:, :, 1:, vs.tau] += -vs.maskT[:, :, 1:] \
@@ -79,12 +79,14 @@ def thermodynamics(vs):
     """
     Adam Bashforth time stepping for advection
     """
-    vs.temp[:, :, :, vs.taup1] = vs.temp[:, :, :, vs.tau] + vs.dt_tracer \
-        * ((1.5 + vs.AB_eps) * vs.dtemp[:, :, :, vs.tau]
-        - (0.5 + vs.AB_eps) * vs.dtemp[:, :, :, vs.taum1]) * vs.maskT
-    vs.salt[:, :, :, vs.taup1] = vs.salt[:, :, :, vs.tau] + vs.dt_tracer \
-        * ((1.5 + vs.AB_eps) * vs.dsalt[:, :, :, vs.tau]
-        - (0.5 + vs.AB_eps) * vs.dsalt[:, :, :, vs.taum1]) * vs.maskT
+    np.add(vs.temp[:, :, :, vs.tau], vs.dt_tracer
+           * ((1.5 + vs.AB_eps) * vs.dtemp[:, :, :, vs.tau]
+           - (0.5 + vs.AB_eps) * vs.dtemp[:, :, :, vs.taum1]) * vs.maskT,
+           out=vs.temp[:, :, :, vs.taup1])
+    np.add(vs.salt[:, :, :, vs.tau], vs.dt_tracer
+           * ((1.5 + vs.AB_eps) * vs.dsalt[:, :, :, vs.tau]
+           - (0.5 + vs.AB_eps) * vs.dsalt[:, :, :, vs.taum1]) * vs.maskT,
+           out=vs.salt[:, :, :, vs.taup1])
 
     """
     horizontal diffusion
@@ -123,13 +125,14 @@ def thermodynamics(vs):
         vs.dtemp_vmix[...] = vs.temp[:, :, :, vs.taup1]
         vs.dsalt_vmix[...] = vs.salt[:, :, :, vs.taup1]
 
-        a_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-        b_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-        c_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-        d_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-        delta = allocate(vs, ('xt', 'yt', 'zw'), include_ghosts=False)
+        # persistent scratch buffers; entries not written below stay zero across calls
+        a_tri, b_tri, c_tri = (
+            scratch(vs, '_vmix_' + name, ('xt', 'yt', 'zt'), include_ghosts=False)
+            for name in ('a_tri', 'b_tri', 'c_tri')
+        )
+        delta = scratch(vs, '_vmix_delta', ('xt', 'yt', 'zw'), include_ghosts=False, fill=None)
 
-        ks = vs.kbot[2:-2, 2:-2] - 1
+        ks = vs.ks_bot
         delta[:, :, :-1] = vs.dt_tracer / vs.dzw[np.newaxis, np.newaxis, :-1] \
             * vs.kappaH[2:-2, 2:-2, :-1]
         delta[:, :, -1] = 0.
@@ -138,16 +141,15 @@ def thermodynamics(vs):
             / vs.dzt[np.newaxis, np.newaxis, 1:]
         b_tri_edge = 1 + delta / vs.dzt[np.newaxis, np.newaxis, :]
         c_tri[:, :, :-1] = -delta[:, :, :-1] / vs.dzt[np.newaxis, np.newaxis, :-1]
-        d_tri[...] = vs.temp[2:-2, 2:-2, :, vs.taup1]
-        d_tri[:, :, -1] += vs.dt_tracer * vs.forc_temp_surface[2:-2, 2:-2] / vs.dzt[-1]
-        sol, mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge)
-        vs.temp[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, mask, sol, vs.temp[2:-2, 2:-2, :, vs.taup1])
-        d_tri[...] = vs.salt[2:-2, 2:-2, :, vs.taup1]
-        d_tri[:, :, -1] += vs.dt_tracer * vs.forc_salt_surface[2:-2, 2:-2] / vs.dzt[-1]
-        sol, mask = utilities.solve_implicit(
-            vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge
-        )
-        vs.salt[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, mask, sol, vs.salt[2:-2, 2:-2, :, vs.taup1])
+        # temperature and salinity share the same mixing coefficients, so both
+        # right-hand sides go through a single batched solve
+        d_tri = np.array([vs.temp[2:-2, 2:-2, :, vs.taup1], vs.salt[2:-2, 2:-2, :, vs.taup1]])
+        d_tri[0, :, :, -1] += vs.dt_tracer * vs.forc_temp_surface[2:-2, 2:-2] / vs.dzt[-1]
+        d_tri[1, :, :, -1] += vs.dt_tracer * vs.forc_salt_surface[2:-2, 2:-2] / vs.dzt[-1]
+        sol, mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge,
+                                             masks=vs.implicit_masks)
+        vs.temp[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, mask, sol[0], vs.temp[2:-2, 2:-2, :, vs.taup1])
+        vs.salt[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, mask, sol[1], vs.salt[2:-2, 2:-2, :, vs.taup1])
 
         vs.dtemp_vmix[...] = (vs.temp[:, :, :, vs.taup1] -
                             vs.dtemp_vmix) / vs.dt_tracer
@@ -224,9 +226,9 @@ def advect_tracer(vs, tr, dtr):
     else:
         advection.adv_flux_2nd(vs, vs.flux_east, vs.flux_north, vs.flux_top, tr)
     dtr[2:-2, 2:-2, :] = vs.maskT[2:-2, 2:-2, :] * (-(vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+                                                    / vs.cost_dxt[2:-2, 2:-2]
                                                    - (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                    / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                    / vs.cost_dyt[:, 2:-2])
     dtr[:, :, 0] += -vs.maskT[:, :, 0] * vs.flux_top[:, :, 0] / vs.dzt[0]
     dtr[:, :, 1:] += -vs.maskT[:, :, 1:] * (vs.flux_top[:, :, 1:] - vs.flux_top[:, :, :-1]) / vs.dzt[1:]
 
@@ -1,17 +1,29 @@
 import math
 
 from .. import veros_method
-from ..variables import allocate
+from ..variables import scratch
 from . import advection, utilities
 
 
+@veros_method
+def init_tke(vs):
+    """
+    Initialize TKE
+    """
+    if vs.enable_kappaH_profile:
+        # Correct diffusivity according to
+        # Bryan, K., and L. J. Lewis, 1979:
+        # A water mass model of the world ocean. J. Geophys. Res., 84, 2503-2517.
+        # It mainly modifies kappaH within 20S - 20N deg. belt
+        vs.kappaH_profile = (0.8 + 1.05 / np.pi
+                             * np.arctan((-vs.zw - 2500.) / 222.2)) * 1e-4
+
+
 @veros_method
 def set_tke_diffusivities(vs):
     """
     set vertical diffusivities based on TKE model
     """
-    Rinumber = allocate(vs, ('xt', 'yt', 'zw'))
-
     if vs.enable_tke:
         vs.sqrttke[...] = np.sqrt(np.maximum(0., vs.tke[:, :, :, vs.tau]))
         """
@@ -54,24 +66,19 @@ def set_tke_diffusivities(vs):
         """
         utilities.enforce_boundaries(vs, vs.K_diss_v)
         vs.kappaM[...] = np.minimum(vs.kappaM_max, vs.c_k * vs.mxl * vs.sqrttke)
-        Rinumber[...] = vs.Nsqr[:, :, :, vs.tau] / \
-            np.maximum(vs.K_diss_v / np.maximum(1e-12, vs.kappaM), 1e-12)
-        if vs.enable_idemix:
-            Rinumber[...] = np.minimum(Rinumber, vs.kappaM * vs.Nsqr[:, :, :, vs.tau]
-                                  / np.maximum(1e-12, vs.alpha_c * vs.E_iw[:, :, :, vs.tau]**2))
         if vs.enable_Prandtl_tke:
+            # the Richardson number only feeds the Prandtl number, so skip it otherwise
+            Rinumber = vs.Nsqr[:, :, :, vs.tau] / \
+                np.maximum(vs.K_diss_v / np.maximum(1e-12, vs.kappaM), 1e-12)
+            if vs.enable_idemix:
+                Rinumber = np.minimum(Rinumber, vs.kappaM * vs.Nsqr[:, :, :, vs.tau]
+                                      / np.maximum(1e-12, vs.alpha_c * vs.E_iw[:, :, :, vs.tau]**2))
             vs.Prandtlnumber[...] = np.maximum(1., np.minimum(10, 6.6 * Rinumber))
         else:
             vs.Prandtlnumber[...] = vs.Prandtl_tke0
         vs.kappaH[...] = np.maximum(vs.kappaH_min, vs.kappaM / vs.Prandtlnumber)
         if vs.enable_kappaH_profile:
-            # Correct diffusivity according to
-            # Bryan, K., and L. J. Lewis, 1979:
-            # A water mass model of the world ocean. J. Geophys. Res., 84, 2503–2517.
-            # It mainly modifies kappaH within 20S - 20N deg. belt
-            vs.kappaH[...] = np.maximum(vs.kappaH, (0.8 + 1.05 / np.pi
-                                                    * np.arctan((-vs.zw[np.newaxis, np.newaxis, :] - 2500.)
-                                                    / 222.2)) * 1e-4)
+            vs.kappaH[...] = np.maximum(vs.kappaH, vs.kappaH_profile[np.newaxis, np.newaxis, :])
         vs.kappaM[...] = np.maximum(vs.kappaM_min, vs.kappaM)
     else:
         vs.kappaM[...] = vs.kappaM_0
@@ -127,13 +134,13 @@ def integrate_tke(vs):
     """
     vertical mixing and dissipation of TKE
     """
-    ks = vs.kbot[2:-2, 2:-2] - 1
+    ks = vs.ks_bot
 
-    a_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    b_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    c_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    d_tri = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
-    delta = allocate(vs, ('xt', 'yt', 'zt'), include_ghosts=False)
+    # persistent scratch buffers; entries not written below stay zero across calls
+    a_tri, b_tri, c_tri, d_tri, delta = (
+        scratch(vs, '_tke_' + name, ('xt', 'yt', 'zt'), include_ghosts=False)
+        for name in ('a_tri', 'b_tri', 'c_tri', 'd_tri', 'delta')
+    )
 
     delta[:, :, :-1] = dt_tke / vs.dzt[np.newaxis, np.newaxis, 1:] * vs.alpha_tke * 0.5 \
         * (vs.kappaM[2:-2, 2:-2, :-1] + vs.kappaM[2:-2, 2:-2, 1:])
@@ -154,7 +161,8 @@ def integrate_tke(vs):
     d_tri[...] = vs.tke[2:-2, 2:-2, :, vs.tau] + dt_tke * forc[2:-2, 2:-2, :]
     d_tri[:, :, -1] += dt_tke * vs.forc_tke_surface[2:-2, 2:-2] / (0.5 * vs.dzw[-1])
 
-    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge)
+    sol, water_mask = utilities.solve_implicit(vs, ks, a_tri, b_tri, c_tri, d_tri, b_edge=b_tri_edge,
+                                               masks=vs.implicit_masks)
     vs.tke[2:-2, 2:-2, :, vs.taup1] = utilities.where(vs, water_mask, sol, vs.tke[2:-2, 2:-2, :, vs.taup1])
 
     """
@@ -165,12 +173,9 @@ def integrate_tke(vs):
     """
     Add TKE if surface density flux drains TKE in uppermost box
     """
-    mask = vs.tke[2:-2, 2:-2, -1, vs.taup1] < 0.0
     vs.tke_surf_corr[...] = 0.
-    vs.tke_surf_corr[2:-2, 2:-2] = utilities.where(vs, mask,
-                                            -vs.tke[2:-2, 2:-2, -1, vs.taup1] * 0.5
-                                               * vs.dzw[-1] / dt_tke,
-                                            0.)
+    vs.tke_surf_corr[2:-2, 2:-2] = np.maximum(0., -vs.tke[2:-2, 2:-2, -1, vs.taup1] * 0.5
+                                                  * vs.dzw[-1] / dt_tke)
     vs.tke[2:-2, 2:-2, -1, vs.taup1] = np.maximum(0., vs.tke[2:-2, 2:-2, -1, vs.taup1])
 
     if vs.enable_tke_hor_diffusion:
@@ -188,9 +193,9 @@ def integrate_tke(vs):
         vs.flux_north[:, -1, :] = 0.
         vs.tke[2:-2, 2:-2, :, vs.taup1] += dt_tke * vs.maskW[2:-2, 2:-2, :] * \
             ((vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-             / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+             / vs.cost_dxt[2:-2, 2:-2]
              + (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-             / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+             / vs.cost_dyt[:, 2:-2])
 
     """
     add tendency due to advection
@@ -205,9 +210,9 @@ def integrate_tke(vs):
         )
     if vs.enable_tke_superbee_advection or vs.enable_tke_upwind_advection:
         vs.dtke[2:-2, 2:-2, :, vs.tau] = vs.maskW[2:-2, 2:-2, :] * (-(vs.flux_east[2:-2, 2:-2, :] - vs.flux_east[1:-3, 2:-2, :])
-                                                                     / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dxt[2:-2, np.newaxis, np.newaxis])
+                                                                     / vs.cost_dxt[2:-2, 2:-2]
                                                                     - (vs.flux_north[2:-2, 2:-2, :] - vs.flux_north[2:-2, 1:-3, :])
-                                                                     / (vs.cost[np.newaxis, 2:-2, np.newaxis] * vs.dyt[np.newaxis, 2:-2, np.newaxis]))
+                                                                     / vs.cost_dyt[:, 2:-2])
         vs.dtke[:, :, 0, vs.tau] += -vs.flux_top[:, :, 0] / vs.dzw[0]
         vs.dtke[:, :, 1:-1, vs.tau] += -(vs.flux_top[:, :, 1:-1] - vs.flux_top[:, :, :-2]) / vs.dzw[1:-1]
         vs.dtke[:, :, -1, vs.tau] += -(vs.flux_top[:, :, -1] - vs.flux_top[:, :, -2]) / (0.5 * vs.dzw[-1])
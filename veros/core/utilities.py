@@ -48,14 +48,18 @@ def pad_z_edges(vs, array):
 
 
 @veros_method(inline=True)
-def solve_implicit(vs, ks, a, b, c, d, b_edge=None, d_edge=None):
+def solve_implicit(vs, ks, a, b, c, d, b_edge=None, d_edge=None, masks=None):
     from .numerics import solve_tridiag  # avoid circular import
 
-    land_mask = (ks >= 0)[:, :, np.newaxis]
-    edge_mask = land_mask & (np.arange(a.shape[2])[np.newaxis, np.newaxis, :]
-                             == ks[:, :, np.newaxis])
-    water_mask = land_mask & (np.arange(a.shape[2])[np.newaxis, np.newaxis, :]
-                              >= ks[:, :, np.newaxis])
+    if masks is not None:
+        # masks precomputed from time-invariant topography (see calc_topo)
+        land_mask, edge_mask, water_mask = masks
+    else:
+        land_mask = (ks >= 0)[:, :, np.newaxis]
+        edge_mask = land_mask & (np.arange(a.shape[2])[np.newaxis, np.newaxis, :]
+                                 == ks[:, :, np.newaxis])
+        water_mask = land_mask & (np.arange(a.shape[2])[np.newaxis, np.newaxis, :]
+                                  >= ks[:, :, np.newaxis])
 
     a_tri = water_mask * a * np.logical_not(edge_mask)
     #a_tri = np.logical_not(edge_mask) * a_tri
@@ -67,4 +71,9 @@ def solve_implicit(vs, ks, a, b, c, d, b_edge=None, d_edge=None):
     if d_edge is not None:
         d_tri = where(vs, edge_mask, d_edge, d_tri)
 
+    if d.ndim > a.ndim:
+        # d contains several right-hand sides sharing the same coefficients
+        sol = np.array([solve_tridiag(vs, a_tri, b_tri, c_tri, d_tri[i]) for i in range(d.shape[0])])
+        return sol, water_mask
+
     return solve_tridiag(vs, a_tri, b_tri, c_tri, d_tri), water_mask
@@ -92,7 +92,7 @@ def write_variable(vs, key, var, var_data, ncfile, time_step=None):
     gridmask = variables.get_grid_mask(vs, var.dims)
     if gridmask is not None:
         newaxes = (slice(None),) * gridmask.ndim + (np.newaxis,) * (var_data.ndim - gridmask.ndim)
-        var_data = np.where(gridmask.astype(np.bool)[newaxes], var_data, variables.FILL_VALUE)
+        var_data = np.where((gridmask != 0)[newaxes], var_data, variables.FILL_VALUE)
 
     if not np.isscalar(var_data):
         tmask = tuple(vs.tau if dim in variables.TIMESTEPS else slice(None) for dim in var.dims)
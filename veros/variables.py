@@ -752,6 +752,29 @@ def allocate(vs, dimensions, dtype=None, include_ghosts=True, local=True, fill=0
         dtype = vs.default_float_type
 
     shape = get_dimensions(vs, dimensions, include_ghosts=include_ghosts, local=local)
+    if fill is None:
+        # leave contents uninitialized; caller must overwrite every element
+        return np.empty(shape, dtype=dtype)
+    if fill == 0:
+        # calloc'ed pages are mapped lazily, so this skips a write pass over the array
+        return np.zeros(shape, dtype=dtype)
     out = np.empty(shape, dtype=dtype)
     out[...] = fill
     return out
+
+
+@veros_method(inline=True)
+def scratch(vs, name, dimensions, **kwargs):
+    """
+    Return a persistent scratch buffer attached to the state object.
+
+    The buffer is created via :func:`allocate` on first use and reused on
+    every subsequent call, so hot kernels avoid reallocating their work
+    arrays each time step. Entries the kernel never writes keep the initial
+    fill value across calls, matching a freshly allocated buffer.
+    """
+    buf = getattr(vs, name, None)
+    if buf is None:
+        buf = allocate(vs, dimensions, **kwargs)
+        setattr(vs, name, buf)
+    return buf
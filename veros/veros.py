@@ -200,6 +200,7 @@ class VerosSetup(metaclass=abc.ABCMeta):
             numerics.calc_initial_conditions(vs)
             streamfunction.streamfunction_init(vs)
             eke.init_eke(vs)
+            tke.init_tke(vs)
 
             vs.diagnostics = diagnostics.create_diagnostics(vs)
             self.set_diagnostics(vs)